@@ -65,4 +65,4 @@ class _AgnoWrapper:
         if self._original_aprocess_model is not None:
             agent._agent.model._aprocess_model_response = self._original_aprocess_model
         if self._original_arun_function_call is not None:
-            agent._agent.model.arun_function_calls = self._original_arun_function_call
+            agent._agent.model.arun_function_call = self._original_arun_function_call
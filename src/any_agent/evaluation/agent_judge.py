@@ -90,9 +90,7 @@ class AgentJudge:
 
         agent_config = AgentConfig(
             model_id=self.model_id,
-            instructions=AGENT_INSTRUCTIONS.format(
-                response_schema=self.output_type.model_json_schema()
-            ),
+            instructions=AGENT_INSTRUCTIONS,
             tools=tooling.get_all_tools() + additional_tools,
             output_type=self.output_type,
             model_args=self.model_args,
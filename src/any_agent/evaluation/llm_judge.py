@@ -1,14 +1,24 @@
+from __future__ import annotations
+
+import asyncio
 import builtins
-from typing import Any
+import functools
+import os
+from typing import TYPE_CHECKING, Any, Self
 
 from any_llm.utils.aio import run_async_in_sync
 from litellm import acompletion
 from litellm.utils import supports_response_schema
-from pydantic import BaseModel
 
 from any_agent.config import AgentFramework
 from any_agent.evaluation.schemas import EvaluationOutput
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from aiohttp import ClientSession
+    from pydantic import BaseModel
+
 INSIDE_NOTEBOOK = hasattr(builtins, "__IPYTHON__")
 
 DEFAULT_PROMPT_TEMPLATE = """Please answer the evaluation question given the following contextual information:
@@ -37,6 +47,29 @@ Your output must match the following JSON schema:
 {response_schema}"""
 
 
+@functools.lru_cache(maxsize=64)
+def _supports_response_schema(model_id: str) -> bool:
+    return supports_response_schema(model=model_id)
+
+
+def _default_max_concurrency() -> int:
+    raw = os.getenv("ANY_AGENT_EVAL_CONCURRENCY", "16")
+    if not raw.isdigit() or int(raw) < 1:
+        msg = f"ANY_AGENT_EVAL_CONCURRENCY must be a positive integer, got {raw!r}"
+        raise ValueError(msg)
+    return int(raw)
+
+
+def _compact_context(context: str, max_chars: int | None) -> str:
+    """Keep the head and tail of `context` when it exceeds `max_chars`."""
+    if max_chars is None or len(context) <= max_chars:
+        return context
+    head = max_chars // 2
+    tail = max_chars - head
+    trimmed = len(context) - max_chars
+    return f"{context[:head]}\n...[trimmed {trimmed} chars]...\n{context[-tail:]}"
+
+
 class LlmJudge:
     def __init__(
         self,
@@ -45,26 +78,57 @@ class LlmJudge:
         output_type: type[BaseModel] = EvaluationOutput,
         model_args: dict[str, Any] | None = None,
         system_prompt: str = LLM_JUDGE_SYSTEM_PROMPT,
+        max_context_chars: int | None = None,
     ):
+        if max_context_chars is not None and max_context_chars < 1:
+            msg = f"max_context_chars must be at least 1, got {max_context_chars}"
+            raise ValueError(msg)
         if model_args is None:
             model_args = {}
         self.model_id = model_id
         self.framework = framework
         self.model_args = model_args
         self.output_type = output_type
+        # When set, longer contexts are trimmed to their head and tail before
+        # being embedded in the prompt, to bound prompt tokens per call.
+        self.max_context_chars = max_context_chars
         self.system_prompt = system_prompt.format(
             response_schema=self.output_type.model_json_schema()
         )
         # If LiteLLM detects that the model supports response_format, set it to the output_type automatically
-        if supports_response_schema(model=self.model_id):
+        if _supports_response_schema(self.model_id):
             self.model_args["response_format"] = self.output_type
+        # Only set while used as an async context manager, so that consecutive
+        # `run_async` calls reuse the same keep-alive connection pool.
+        self._session: ClientSession | None = None
+
+    async def __aenter__(self) -> Self:
+        """Open an HTTP session shared by the LLM calls made inside the block."""
+        if self._session is not None:
+            msg = "LlmJudge already has an open session and cannot be entered again"
+            raise RuntimeError(msg)
+
+        from aiohttp import ClientSession, TCPConnector
+
+        self._session = ClientSession(connector=TCPConnector(limit_per_host=32))
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the shared HTTP session."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session shared across LLM calls, if any."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def _create_prompt(self, context: str, question: str, prompt: str) -> str:
         if "{context}" not in prompt or "{question}" not in prompt:
             msg = "Prompt must contain the following placeholders: {context} and {question}"
             raise ValueError(msg)
         return prompt.format(
-            context=context,
+            context=_compact_context(context, self.max_context_chars),
             question=question,
         )
 
@@ -116,9 +180,68 @@ class LlmJudge:
                 {"role": "system", "content": self.system_prompt},
                 {"role": "user", "content": prompt},
             ],
+            shared_session=self._session,
             **self.model_args,
         )
 
         return self.output_type.model_validate_json(
             response.choices[0].message["content"]
         )
+
+    def run_batch(
+        self,
+        context: str,
+        questions: Sequence[str],
+        prompt_template: str = DEFAULT_PROMPT_TEMPLATE,
+        max_concurrency: int | None = None,
+    ) -> list[BaseModel]:
+        """Run the judge synchronously over several questions sharing the same context.
+
+        Args:
+            context: Any relevant information that may be needed to answer the questions
+            questions: The questions to ask the LLM
+            prompt_template: The prompt to use for the LLM
+            max_concurrency: Maximum number of LLM calls in flight at the same time.
+                Defaults to the `ANY_AGENT_EVAL_CONCURRENCY` environment variable, or 16.
+
+        Returns:
+            The evaluation results, in the same order as `questions`
+
+        """
+        return run_async_in_sync(
+            self.run_batch_async(context, questions, prompt_template, max_concurrency),
+            allow_running_loop=INSIDE_NOTEBOOK,
+        )
+
+    async def run_batch_async(
+        self,
+        context: str,
+        questions: Sequence[str],
+        prompt_template: str = DEFAULT_PROMPT_TEMPLATE,
+        max_concurrency: int | None = None,
+    ) -> list[BaseModel]:
+        """Run the judge asynchronously over several questions sharing the same context.
+
+        Args:
+            context: Any relevant information that may be needed to answer the questions
+            questions: The questions to ask the LLM
+            prompt_template: The prompt to use for the LLM
+            max_concurrency: Maximum number of LLM calls in flight at the same time.
+                Defaults to the `ANY_AGENT_EVAL_CONCURRENCY` environment variable, or 16.
+
+        Returns:
+            The evaluation results, in the same order as `questions`
+
+        """
+        if max_concurrency is None:
+            max_concurrency = _default_max_concurrency()
+        elif max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_one(question: str) -> BaseModel:
+            async with semaphore:
+                return await self.run_async(context, question, prompt_template)
+
+        return list(await asyncio.gather(*(_run_one(q) for q in questions)))
@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Callable
 from typing import Any
 
@@ -5,6 +6,21 @@ from pydantic import BaseModel
 
 from any_agent.tracing.agent_trace import AgentTrace
 
+_NON_TOOL_ATTRIBUTES = ("get_all_tools", "trace")
+
+
+def _is_tool_name(attr_name: str) -> bool:
+    return not attr_name.startswith("_") and attr_name not in _NON_TOOL_ATTRIBUTES
+
+
+@functools.cache
+def _tool_names_for(cls: type) -> tuple[str, ...]:
+    return tuple(
+        attr_name
+        for attr_name in dir(cls)
+        if _is_tool_name(attr_name) and callable(getattr(cls, attr_name))
+    )
+
 
 class TraceTools:
     def __init__(self, trace: AgentTrace):
@@ -13,18 +29,22 @@ class TraceTools:
     def get_all_tools(self) -> list[Callable[..., Any]]:
         """Get all tool functions from this class.
 
+        The public methods (other than `get_all_tools`) are looked up once
+        per class. Public callables set on the instance are included too.
+
         Returns:
             list[callable]: List of all tool functions
 
         """
-        # Get all methods that don't start with underscore and aren't get_all_tools
-        tools = []
-        for attr_name in dir(self):
-            if not attr_name.startswith("_") and attr_name != "get_all_tools":
-                attr = getattr(self, attr_name)
-                if callable(attr) and attr_name not in ["trace"]:
-                    tools.append(attr)
-        return tools
+        names = _tool_names_for(type(self))  # type: ignore[arg-type]
+        instance_names = [
+            attr_name
+            for attr_name in vars(self)
+            if _is_tool_name(attr_name) and attr_name not in names
+        ]
+        if instance_names:
+            names = tuple(sorted((*names, *instance_names)))
+        return [tool for name in names if callable(tool := getattr(self, name))]
 
     def get_final_output(self) -> str | BaseModel | dict[str, Any] | None:
         """Get the final output from the agent trace.
@@ -63,10 +83,9 @@ class TraceTools:
 
         """
         messages = self.trace.spans_to_messages()
-        evidence = ""
-        for message in messages:
-            evidence += f"### {message.role}\n{message.content}\n\n"
-        return evidence
+        return "".join(
+            f"### {message.role}\n{message.content}\n\n" for message in messages
+        )
 
     def get_duration(self) -> float:
         """Get the duration of the agent trace.
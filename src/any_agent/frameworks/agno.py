@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 from any_llm import acompletion, completion
@@ -43,57 +44,82 @@ class AnyLLM(Model):
 
     request_params: dict[str, Any] | None = None
 
+    _base_request_params: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the request parameters shared by every call."""
+        super().__post_init__()  # type: ignore[no-untyped-call]
+        self._base_request_params = {
+            "model": self.id,
+            "api_base": self.api_base,
+            "api_key": self.api_key,
+            **(self.request_params or {}),
+        }
+
+    @staticmethod
+    def _format_message(m: Message) -> dict[str, Any]:
+        msg = {
+            "role": m.role,
+            "content": m.content if m.content is not None else "",
+        }
+
+        if m.role == "assistant" and m.tool_calls:
+            msg["tool_calls"] = [
+                {
+                    "id": tc.get("id", f"call_{i}"),
+                    "type": "function",
+                    "function": {
+                        "name": tc["function"]["name"],
+                        "arguments": tc["function"]["arguments"],
+                    },
+                }
+                for i, tc in enumerate(m.tool_calls)
+            ]
+
+        if m.role == "tool":
+            msg["tool_call_id"] = m.tool_call_id or ""
+            msg["name"] = m.name or ""
+
+        return msg
+
     def _format_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
-        """Format messages for any-llm API."""
-        formatted_messages = []
-        for m in messages:
-            msg = {
-                "role": m.role,
-                "content": m.content if m.content is not None else "",
-            }
-
-            if m.role == "assistant" and m.tool_calls:
-                msg["tool_calls"] = [
-                    {
-                        "id": tc.get("id", f"call_{i}"),
-                        "type": "function",
-                        "function": {
-                            "name": tc["function"]["name"],
-                            "arguments": tc["function"]["arguments"],
-                        },
-                    }
-                    for i, tc in enumerate(m.tool_calls)
-                ]
-
-            if m.role == "tool":
-                msg["tool_call_id"] = m.tool_call_id or ""
-                msg["name"] = m.name or ""
-
-            formatted_messages.append(msg)
-
-        return formatted_messages
+        """Format messages for any-llm API.
+
+        Fresh dicts are built on every call, since providers may edit the
+        messages they are given in place.
+        """
+        return [self._format_message(m) for m in messages]
 
     def get_request_params(
         self, tools: list[dict[str, Any]] | None = None
     ) -> dict[str, Any]:
         """Return keyword arguments for API requests.
 
+        The base parameters are built once in `__post_init__`, so `id`,
+        `api_base`, `api_key` and `request_params` should not be changed
+        after construction.
+
         Returns:
             Dict[str, Any]: The API kwargs for the model.
 
         """
-        request_params: dict[str, Any] = {
-            "model": self.id,
-            "api_base": self.api_base,
-            "api_key": self.api_key,
-            **self.request_params,  # type: ignore[dict-item]
-        }
-
         if tools:
-            request_params["tools"] = tools
-            request_params["tool_choice"] = "auto"
+            return self._base_request_params | {"tools": tools, "tool_choice": "auto"}
+        return self._base_request_params.copy()
 
-        return request_params
+    def _completion_kwargs(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None,
+        stream: bool = False,
+    ) -> dict[str, Any]:
+        completion_kwargs = self.get_request_params(tools=tools)
+        completion_kwargs["messages"] = self._format_messages(messages)
+        if stream:
+            completion_kwargs["stream"] = True
+        return completion_kwargs
 
     def invoke(
         self,
@@ -102,9 +128,7 @@ class AnyLLM(Model):
         tools: list[dict[str, Any]] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
     ) -> Any:
-        completion_kwargs = self.get_request_params(tools=tools)
-        completion_kwargs["messages"] = self._format_messages(messages)
-        return completion(**completion_kwargs)
+        return completion(**self._completion_kwargs(messages, tools))
 
     async def ainvoke(
         self,
@@ -113,9 +137,7 @@ class AnyLLM(Model):
         tools: list[dict[str, Any]] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
     ) -> Any:
-        completion_kwargs = self.get_request_params(tools=tools)
-        completion_kwargs["messages"] = self._format_messages(messages)
-        return await acompletion(**completion_kwargs)
+        return await acompletion(**self._completion_kwargs(messages, tools))
 
     def invoke_stream(
         self,
@@ -124,10 +146,7 @@ class AnyLLM(Model):
         tools: list[dict[str, Any]] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
     ) -> Any:
-        completion_kwargs = self.get_request_params(tools=tools)
-        completion_kwargs["messages"] = self._format_messages(messages)
-        completion_kwargs["stream"] = True
-        return completion(**completion_kwargs)
+        return completion(**self._completion_kwargs(messages, tools, stream=True))
 
     async def ainvoke_stream(
         self,
@@ -136,10 +155,7 @@ class AnyLLM(Model):
         tools: list[dict[str, Any]] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
     ) -> Any:
-        completion_kwargs = self.get_request_params(tools=tools)
-        completion_kwargs["messages"] = self._format_messages(messages)
-        completion_kwargs["stream"] = True
-        return acompletion(**completion_kwargs)
+        return acompletion(**self._completion_kwargs(messages, tools, stream=True))
 
     def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:  # type: ignore[no-untyped-def]
         """Parse the provider response."""
@@ -150,19 +166,19 @@ class AnyLLM(Model):
         if response_message.content is not None:
             model_response.content = response_message.content
 
-        if hasattr(response_message, "tool_calls") and response_message.tool_calls:
-            model_response.tool_calls = []
-            for tool_call in response_message.tool_calls:
-                model_response.tool_calls.append(
-                    {
-                        "id": tool_call.id,
-                        "type": "function",
-                        "function": {
-                            "name": tool_call.function.name,
-                            "arguments": tool_call.function.arguments,
-                        },
-                    }
-                )
+        tool_calls = getattr(response_message, "tool_calls", None)
+        if tool_calls:
+            model_response.tool_calls = [
+                {
+                    "id": tool_call.id,
+                    "type": "function",
+                    "function": {
+                        "name": tool_call.function.name,
+                        "arguments": tool_call.function.arguments,
+                    },
+                }
+                for tool_call in tool_calls
+            ]
 
         if response.usage is not None:
             model_response.response_usage = response.usage
@@ -173,52 +189,45 @@ class AnyLLM(Model):
         """Parse the provider response delta for streaming responses."""
         model_response = ModelResponse()
 
-        if hasattr(response_delta, "choices") and len(response_delta.choices) > 0:
-            choice_delta = response_delta.choices[0].delta
+        choices = getattr(response_delta, "choices", None)
+        if choices:
+            choice_delta = choices[0].delta
 
             if choice_delta:
-                if (
-                    hasattr(choice_delta, "content")
-                    and choice_delta.content is not None
-                ):
-                    model_response.content = choice_delta.content
+                content = getattr(choice_delta, "content", None)
+                if content is not None:
+                    model_response.content = content
 
-                if hasattr(choice_delta, "tool_calls") and choice_delta.tool_calls:
+                tool_calls = getattr(choice_delta, "tool_calls", None)
+                if tool_calls:
                     processed_tool_calls = []
-                    for tool_call in choice_delta.tool_calls:
-                        actual_index = (
-                            getattr(tool_call, "index", 0)
-                            if hasattr(tool_call, "index")
-                            else 0
-                        )
-
-                        tool_call_dict = {"index": actual_index, "type": "function"}
+                    for tool_call in tool_calls:
+                        tool_call_dict: dict[str, Any] = {
+                            "index": getattr(tool_call, "index", 0),
+                            "type": "function",
+                        }
 
-                        if hasattr(tool_call, "id") and tool_call.id is not None:
-                            tool_call_dict["id"] = tool_call.id
+                        tool_call_id = getattr(tool_call, "id", None)
+                        if tool_call_id is not None:
+                            tool_call_dict["id"] = tool_call_id
 
                         function_data = {}
-                        if hasattr(tool_call, "function"):
-                            if (
-                                hasattr(tool_call.function, "name")
-                                and tool_call.function.name is not None
-                            ):
-                                function_data["name"] = tool_call.function.name
-                            if (
-                                hasattr(tool_call.function, "arguments")
-                                and tool_call.function.arguments is not None
-                            ):
-                                function_data["arguments"] = (
-                                    tool_call.function.arguments
-                                )
+                        function = getattr(tool_call, "function", None)
+                        name = getattr(function, "name", None)
+                        if name is not None:
+                            function_data["name"] = name
+                        arguments = getattr(function, "arguments", None)
+                        if arguments is not None:
+                            function_data["arguments"] = arguments
 
                         tool_call_dict["function"] = function_data
                         processed_tool_calls.append(tool_call_dict)
 
                     model_response.tool_calls = processed_tool_calls
 
-        if hasattr(response_delta, "usage") and response_delta.usage is not None:
-            model_response.response_usage = response_delta.usage
+        usage = getattr(response_delta, "usage", None)
+        if usage is not None:
+            model_response.response_usage = usage
 
         return model_response
 
@@ -232,6 +241,8 @@ class AgnoAgent(AnyAgent):
     def __init__(self, config: AgentConfig):
         super().__init__(config)
         self._agent: Agent | None = None
+        self._model: Model | None = None
+        self._loaded_tools: list[Any] = []
 
     @property
     def framework(self) -> AgentFramework:
@@ -250,13 +261,12 @@ class AgnoAgent(AnyAgent):
 
     @staticmethod
     def _unpack_tools(tools: list[Any]) -> list[Any]:
-        unpacked: list[Any] = []
-        for tool in tools:
-            if isinstance(tool, Toolkit):
-                unpacked.extend(f for f in tool.functions.values())
-            else:
-                unpacked.append(tool)
-        return unpacked
+        return list(
+            chain.from_iterable(
+                tool.functions.values() if isinstance(tool, Toolkit) else (tool,)
+                for tool in tools
+            )
+        )
 
     async def _load_agent(self) -> None:
         if not agno_available:
@@ -265,15 +275,17 @@ class AgnoAgent(AnyAgent):
 
         tools = await self._load_tools(self.config.tools)
 
+        self._loaded_tools = tools
         self._tools = self._unpack_tools(tools)
 
         agent_args = self.config.agent_args or {}
         if self.config.output_type:
             agent_args["response_model"] = self.config.output_type
+        self._model = self._get_model(self.config)
         self._agent = Agent(
             name=self.config.name,
             instructions=self.config.instructions,
-            model=self._get_model(self.config),
+            model=self._model,
             tools=tools,
             **agent_args,
         )
@@ -299,10 +311,10 @@ class AgnoAgent(AnyAgent):
         # If agent is already loaded, we need to recreate it with the new output type
         # The AGNO agent requires response_model to be set during construction
         if self._agent:
-            # Rebuild tools list from original config
-            tools = await self._load_tools(self.config.tools)
-
-            # Recreate the agent with the new configuration
+            # Recreate the agent with the new configuration.
+            # The tools and model do not depend on the output type, so the
+            # ones loaded in _load_agent are reused (reloading the tools would
+            # also open new MCP connections).
             agent_args = self.config.agent_args or {}
             if output_type:
                 agent_args["response_model"] = output_type
@@ -310,10 +322,7 @@ class AgnoAgent(AnyAgent):
             self._agent = Agent(
                 name=self.config.name,
                 instructions=self.config.instructions,
-                model=self._get_model(self.config),
-                tools=tools,
+                model=self._model,
+                tools=self._loaded_tools,
                 **agent_args,
             )
-
-            # Update the tools list
-            self._tools = self._unpack_tools(tools)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+import functools
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, assert_never, overload
 
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from opentelemetry.trace import Tracer
+    from opentelemetry.util.types import AttributeValue
     from pydantic import BaseModel
 
     from any_agent.serving import A2AServingConfig, MCPServingConfig, ServerHandle
@@ -83,12 +85,27 @@ class AnyAgent(ABC):
         self._lock = asyncio.Lock()
         self._callback_contexts: dict[int, Context] = {}
 
+        # The invoke_agent span only depends on the config, so its name and
+        # attributes are built once instead of on every run.
+        self._invoke_span_name = f"invoke_agent [{config.name}]"
+        self._invoke_span_attributes: dict[str, AttributeValue] = {
+            GenAI.OPERATION_NAME: "invoke_agent",
+            GenAI.AGENT_NAME: config.name,
+            GenAI.AGENT_DESCRIPTION: config.description or "No description.",
+            GenAI.REQUEST_MODEL: config.model_id,
+        }
+
     @staticmethod
     def _get_agent_type_by_framework(
         framework_raw: AgentFramework | str,
     ) -> type[AnyAgent]:
-        framework = AgentFramework.from_string(framework_raw)
+        return AnyAgent._resolve_agent_type(AgentFramework.from_string(framework_raw))
 
+    @staticmethod
+    @functools.cache
+    def _resolve_agent_type(framework: AgentFramework) -> type[AnyAgent]:
+        # Cached so that only the first agent of each framework goes
+        # through the import machinery.
         if framework is AgentFramework.SMOLAGENTS:
             from any_agent.frameworks.smolagents import SmolagentsAgent
 
@@ -180,12 +197,13 @@ class AnyAgent(ABC):
 
         """
         trace = AgentTrace()
-        trace_id: int
+        trace_id: int | None = None
+        error: Exception | None = None
 
         # This design is so that we only catch exceptions thrown by _run_async. All other exceptions will not be caught.
         try:
             with self._tracer.start_as_current_span(
-                f"invoke_agent [{self.config.name}]"
+                self._invoke_span_name
             ) as invoke_span:
                 async with self._lock:
                     trace_id = invoke_span.get_span_context().trace_id
@@ -203,15 +221,7 @@ class AnyAgent(ABC):
                             agent=self,  # type: ignore[arg-type]
                         )
 
-                invoke_span.set_attributes(
-                    {
-                        GenAI.OPERATION_NAME: "invoke_agent",
-                        GenAI.AGENT_NAME: self.config.name,
-                        GenAI.AGENT_DESCRIPTION: self.config.description
-                        or "No description.",
-                        GenAI.REQUEST_MODEL: self.config.model_id,
-                    }
-                )
+                invoke_span.set_attributes(self._invoke_span_attributes)
 
                 context = self._wrapper.callback_context[trace_id]
                 for callback in self.config.callbacks:
@@ -222,32 +232,27 @@ class AnyAgent(ABC):
                 final_output = await self._run_async(prompt, **kwargs)
 
         except Exception as e:
-            async with self._lock:
-                if len(self._wrapper.callback_context) == 1:
-                    await self._wrapper.unwrap(self)  # type: ignore[arg-type]
-                if wrapped_context := self._wrapper.callback_context.pop(
-                    trace_id, None
-                ):
-                    trace = wrapped_context.trace
-                    for callback in self.config.callbacks:
-                        wrapped_context = callback.after_agent_invocation(
-                            wrapped_context, prompt, **kwargs
-                        )
-
-            trace.add_span(invoke_span)
-            raise AgentRunError(trace, e) from e
+            error = e
 
-        async with self._lock:
-            if len(self._wrapper.callback_context) == 1:
-                await self._wrapper.unwrap(self)  # type: ignore[arg-type]
-            if wrapped_context := self._wrapper.callback_context.pop(trace_id, None):
-                trace = wrapped_context.trace
-                for callback in self.config.callbacks:
-                    wrapped_context = callback.after_agent_invocation(
-                        wrapped_context, prompt, **kwargs
-                    )
+        finally:
+            # Runs once per run, including cancelled ones, so that the agent
+            # is always unwrapped and its callback context released.
+            if trace_id is not None:
+                async with self._lock:
+                    if len(self._wrapper.callback_context) == 1:
+                        await self._wrapper.unwrap(self)  # type: ignore[arg-type]
+                    if wrapped_context := self._wrapper.callback_context.pop(
+                        trace_id, None
+                    ):
+                        trace = wrapped_context.trace
+                        for callback in self.config.callbacks:
+                            wrapped_context = callback.after_agent_invocation(
+                                wrapped_context, prompt, **kwargs
+                            )
 
         trace.add_span(invoke_span)
+        if error is not None:
+            raise AgentRunError(trace, error) from error
         trace.final_output = final_output
         return trace
 
@@ -81,7 +81,7 @@ async def a2a_tool_async(
                         role=Role.user,
                         parts=[Part(root=TextPart(text=query))],
                         # the id is not currently tracked
-                        message_id=str(uuid4().hex),
+                        message_id=uuid4().hex,
                         task_id=task_id,
                         context_id=context_id,
                     )
@@ -160,14 +160,13 @@ async def _wrap_tools(
 
             # For smolagents, the tools are already SmolagentsTool objects, so we don't need to wrap them
             if agent_framework == AgentFramework.SMOLAGENTS:
-                for callable_tool in callable_tools:
-                    wrapped_tools.append(callable_tool)  # type: ignore[arg-type]
+                wrapped_tools.extend(callable_tools)  # type: ignore[arg-type]
             else:
                 # Wrap each callable tool with the framework wrapper
-                for callable_tool in callable_tools:
-                    wrapped_tools.append(
-                        framework_wrapper(_wrap_no_exception(callable_tool))
-                    )
+                wrapped_tools.extend(
+                    framework_wrapper(_wrap_no_exception(callable_tool))
+                    for callable_tool in callable_tools
+                )
 
             mcp_clients.append(mcp_client)
         elif callable(tool):
@@ -7,7 +7,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal
 
 from opentelemetry.sdk.trace import ReadableSpan
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from any_agent.logging import logger
 
@@ -42,7 +42,7 @@ class TokenInfo(BaseModel):
         """Total number of tokens."""
         return self.input_tokens + self.output_tokens
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class CostInfo(BaseModel):
@@ -59,7 +59,7 @@ class CostInfo(BaseModel):
         """Total cost."""
         return self.input_cost + self.output_cost
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class AgentMessage(BaseModel):
@@ -71,6 +71,10 @@ class AgentMessage(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+# Validates a whole list of messages in a single pydantic-core call.
+_AGENT_MESSAGES_ADAPTER = TypeAdapter(list[AgentMessage])
+
+
 class AgentSpan(BaseModel):
     """A span that can be exported to JSON or printed to the console."""
 
@@ -164,7 +168,7 @@ class AgentSpan(BaseModel):
         if not isinstance(parsed_messages, list):
             msg = "Input messages are not a list of messages"
             raise ValueError(msg)
-        return [AgentMessage.model_validate(msg) for msg in parsed_messages]
+        return _AGENT_MESSAGES_ADAPTER.validate_python(parsed_messages)
 
     def get_output_content(self) -> str | None:
         """Extract output content from an LLM call or tool execution span.
@@ -204,17 +208,30 @@ class AgentTrace(BaseModel):
         if "cost" in self.__dict__:
             del self.cost
 
+    def _update_tokens_and_cost_cache(self, spans: list[AgentSpan]) -> None:
+        """Fold newly added spans into the cached tokens and cost, if they were computed.
+
+        This keeps the totals up to date in O(len(spans)) instead of
+        recomputing them over the whole trace on the next access.
+        """
+        tokens = self.__dict__.get("tokens")
+        cost = self.__dict__.get("cost")
+        if tokens is None or cost is None:
+            self._invalidate_tokens_and_cost_cache()
+            return
+        self._accumulate_tokens_and_cost(spans, tokens, cost)
+
     def add_span(self, span: AgentSpan | Span) -> None:
-        """Add an AgentSpan to the trace and clear the tokens_and_cost cache if present."""
+        """Add an AgentSpan to the trace and update the tokens_and_cost cache if present."""
         if not isinstance(span, AgentSpan):
             span = AgentSpan.from_otel(span)
         self.spans.append(span)
-        self._invalidate_tokens_and_cost_cache()
+        self._update_tokens_and_cost_cache([span])
 
     def add_spans(self, spans: list[AgentSpan]) -> None:
-        """Add a list of AgentSpans to the trace and clear the tokens_and_cost cache if present."""
+        """Add a list of AgentSpans to the trace and update the tokens_and_cost cache if present."""
         self.spans.extend(spans)
-        self._invalidate_tokens_and_cost_cache()
+        self._update_tokens_and_cost_cache(spans)
 
     def spans_to_messages(self) -> list[AgentMessage]:
         """Convert spans to standard message format.
@@ -293,24 +310,47 @@ class AgentTrace(BaseModel):
         msg = "Start or end time is missing for the `invoke_agent` span"
         raise ValueError(msg)
 
+    def _compute_tokens_and_cost(self) -> tuple[TokenInfo, CostInfo]:
+        """Sum token and cost usage over the LLM call spans in a single pass.
+
+        Both results are cached, so accessing `tokens` and then `cost` (or the
+        other way around) only walks the spans once.
+        """
+        return self._accumulate_tokens_and_cost(
+            self.spans,
+            TokenInfo(input_tokens=0, output_tokens=0),
+            CostInfo(input_cost=0.0, output_cost=0.0),
+        )
+
+    def _accumulate_tokens_and_cost(
+        self, spans: list[AgentSpan], tokens: TokenInfo, cost: CostInfo
+    ) -> tuple[TokenInfo, CostInfo]:
+        """Add the usage of the LLM call spans in `spans` to `tokens` and `cost` and cache the result."""
+        sum_input_tokens = tokens.input_tokens
+        sum_output_tokens = tokens.output_tokens
+        sum_input_cost = cost.input_cost
+        sum_output_cost = cost.output_cost
+        for span in spans:
+            if span.is_llm_call():
+                attributes = span.attributes
+                sum_input_tokens += attributes.get(GenAI.USAGE_INPUT_TOKENS, 0)
+                sum_output_tokens += attributes.get(GenAI.USAGE_OUTPUT_TOKENS, 0)
+                sum_input_cost += attributes.get(GenAI.USAGE_INPUT_COST, 0)
+                sum_output_cost += attributes.get(GenAI.USAGE_OUTPUT_COST, 0)
+        tokens = TokenInfo(
+            input_tokens=sum_input_tokens, output_tokens=sum_output_tokens
+        )
+        cost = CostInfo(input_cost=sum_input_cost, output_cost=sum_output_cost)
+        self.__dict__["tokens"] = tokens
+        self.__dict__["cost"] = cost
+        return tokens, cost
+
     @cached_property
     def tokens(self) -> TokenInfo:
         """The [`TokenInfo`][any_agent.tracing.agent_trace.TokenInfo] for this trace. Cached after first computation."""
-        sum_input_tokens = 0
-        sum_output_tokens = 0
-        for span in self.spans:
-            if span.is_llm_call():
-                sum_input_tokens += span.attributes.get(GenAI.USAGE_INPUT_TOKENS, 0)
-                sum_output_tokens += span.attributes.get(GenAI.USAGE_OUTPUT_TOKENS, 0)
-        return TokenInfo(input_tokens=sum_input_tokens, output_tokens=sum_output_tokens)
+        return self._compute_tokens_and_cost()[0]
 
     @cached_property
     def cost(self) -> CostInfo:
         """The [`CostInfo`][any_agent.tracing.agent_trace.CostInfo] for this trace. Cached after first computation."""
-        sum_input_cost = 0.0
-        sum_output_cost = 0.0
-        for span in self.spans:
-            if span.is_llm_call():
-                sum_input_cost += span.attributes.get(GenAI.USAGE_INPUT_COST, 0)
-                sum_output_cost += span.attributes.get(GenAI.USAGE_OUTPUT_COST, 0)
-        return CostInfo(input_cost=sum_input_cost, output_cost=sum_output_cost)
+        return self._compute_tokens_and_cost()[1]
@@ -53,8 +53,12 @@ def test_evaluation_md() -> None:
         mock_result.suggestions = ["Mock suggestion 1", "Mock suggestion 2"]
         return mock_result
 
+    def mock_run_batch_method(*args: Any, **kwargs: Any) -> Any:
+        return [mock_run_method() for _ in kwargs["questions"]]
+
     mock_judge = MagicMock()
     mock_judge.run.side_effect = mock_run_method
+    mock_judge.run_batch.side_effect = mock_run_batch_method
 
     mock_create_async = AsyncMock()
     with (
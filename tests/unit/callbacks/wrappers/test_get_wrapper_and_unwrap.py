@@ -30,3 +30,20 @@ async def test_google_instrument_uninstrument() -> None:
     assert agent._agent.after_model_callback is None
     assert agent._agent.before_tool_callback is None
     assert agent._agent.after_tool_callback is None
+
+
+async def test_agno_wrap_unwrap() -> None:
+    agent = MagicMock()
+    original_llm_call = agent._agent.model._aprocess_model_response
+    original_tool_call = agent._agent.model.arun_function_call
+
+    wrapper = _get_wrapper_by_framework(AgentFramework.AGNO)
+
+    for _ in range(2):
+        await wrapper.wrap(agent)
+        assert agent._agent.model._aprocess_model_response is not original_llm_call
+        assert agent._agent.model.arun_function_call is not original_tool_call
+
+        await wrapper.unwrap(agent)
+        assert agent._agent.model._aprocess_model_response is original_llm_call
+        assert agent._agent.model.arun_function_call is original_tool_call
@@ -0,0 +1,161 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from any_agent.evaluation.llm_judge import LlmJudge
+from any_agent.evaluation.schemas import EvaluationOutput
+
+
+def _mock_response(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices[0].message = {"content": content}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_llm_judge_reuses_shared_session() -> None:
+    mock_acompletion = AsyncMock(
+        return_value=_mock_response('{"passed": true, "reasoning": "ok"}')
+    )
+    with patch("any_agent.evaluation.llm_judge.acompletion", mock_acompletion):
+        async with LlmJudge(model_id="mistral/mistral-small-latest") as judge:
+            session = judge._session
+            assert session is not None
+            result = await judge.run_async(context="foo", question="bar?")
+            await judge.run_async(context="foo", question="baz?")
+
+        assert isinstance(result, EvaluationOutput)
+        assert result.passed
+        for call in mock_acompletion.call_args_list:
+            assert call.kwargs["shared_session"] is session
+        assert session.closed
+        assert judge._session is None
+
+
+@pytest.mark.asyncio
+async def test_llm_judge_cannot_be_entered_twice() -> None:
+    async with LlmJudge(model_id="mistral/mistral-small-latest") as judge:
+        session = judge._session
+        with pytest.raises(RuntimeError, match="already has an open session"):
+            await judge.__aenter__()
+        assert judge._session is session
+        assert session is not None
+        assert not session.closed
+
+    assert session.closed
+
+
+def test_llm_judge_without_session() -> None:
+    mock_acompletion = AsyncMock(
+        return_value=_mock_response('{"passed": false, "reasoning": "no"}')
+    )
+    with patch("any_agent.evaluation.llm_judge.acompletion", mock_acompletion):
+        judge = LlmJudge(model_id="mistral/mistral-small-latest")
+        result = judge.run(context="foo", question="bar?")
+
+    assert isinstance(result, EvaluationOutput)
+    assert not result.passed
+    assert mock_acompletion.call_args.kwargs["shared_session"] is None
+
+
+def test_llm_judge_run_batch_preserves_order() -> None:
+    async def fake_acompletion(**kwargs: object) -> MagicMock:
+        prompt = kwargs["messages"][1]["content"]  # type: ignore[index]
+        passed = "true" if prompt.endswith("yes?") else "false"
+        return _mock_response(f'{{"passed": {passed}, "reasoning": "ok"}}')
+
+    with patch("any_agent.evaluation.llm_judge.acompletion", fake_acompletion):
+        judge = LlmJudge(model_id="mistral/mistral-small-latest")
+        results = judge.run_batch(
+            context="foo", questions=["yes?", "no?", "yes?"], max_concurrency=2
+        )
+
+    assert [r.passed for r in results] == [True, False, True]  # type: ignore[attr-defined]
+
+
+def test_llm_judge_run_batch_concurrency_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_acompletion = AsyncMock(
+        return_value=_mock_response('{"passed": true, "reasoning": "ok"}')
+    )
+    judge = LlmJudge(model_id="mistral/mistral-small-latest")
+    with patch("any_agent.evaluation.llm_judge.acompletion", mock_acompletion):
+        monkeypatch.setenv("ANY_AGENT_EVAL_CONCURRENCY", "2")
+        results = judge.run_batch(context="foo", questions=["a?", "b?", "c?"])
+        assert len(results) == 3
+
+        monkeypatch.setenv("ANY_AGENT_EVAL_CONCURRENCY", "many")
+        with pytest.raises(ValueError, match="ANY_AGENT_EVAL_CONCURRENCY"):
+            judge.run_batch(context="foo", questions=["a?"])
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_llm_judge_run_batch_rejects_non_positive_concurrency(
+    max_concurrency: int,
+) -> None:
+    judge = LlmJudge(model_id="mistral/mistral-small-latest")
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        judge.run_batch(
+            context="foo", questions=["a?"], max_concurrency=max_concurrency
+        )
+
+
+def test_llm_judge_max_context_chars() -> None:
+    judge = LlmJudge(model_id="mistral/mistral-small-latest", max_context_chars=10)
+
+    prompt = judge._create_prompt(
+        "a" * 5 + "b" * 20 + "c" * 5, "q?", "{context}|{question}"
+    )
+
+    assert prompt == "aaaaa\n...[trimmed 20 chars]...\nccccc|q?"
+    assert judge._create_prompt("short", "q?", "{context}|{question}") == "short|q?"
+
+
+@pytest.mark.parametrize("max_context_chars", [0, -3])
+def test_llm_judge_rejects_non_positive_max_context_chars(
+    max_context_chars: int,
+) -> None:
+    with pytest.raises(ValueError, match="max_context_chars must be at least 1"):
+        LlmJudge(
+            model_id="mistral/mistral-small-latest",
+            max_context_chars=max_context_chars,
+        )
+
+
+def test_llm_judge_max_context_chars_of_one() -> None:
+    judge = LlmJudge(model_id="mistral/mistral-small-latest", max_context_chars=1)
+
+    prompt = judge._create_prompt("abcdefghij", "q?", "{context}|{question}")
+
+    assert prompt == "\n...[trimmed 9 chars]...\nj|q?"
+
+
+def test_llm_judge_run_batch_trims_context_once() -> None:
+    mock_acompletion = AsyncMock(
+        return_value=_mock_response('{"passed": true, "reasoning": "ok"}')
+    )
+    context = "a" * 5 + "b" * 1000 + "c" * 5
+    with patch("any_agent.evaluation.llm_judge.acompletion", mock_acompletion):
+        judge = LlmJudge(model_id="mistral/mistral-small-latest", max_context_chars=10)
+        judge.run(context=context, question="q?")
+        judge.run_batch(context=context, questions=["q?", "q?"])
+
+    prompts = [
+        call.kwargs["messages"][1]["content"]
+        for call in mock_acompletion.call_args_list
+    ]
+    assert len(prompts) == 3
+    for prompt in prompts:
+        assert "aaaaa\n...[trimmed 1000 chars]...\nccccc" in prompt
+
+
+def test_supports_response_schema_is_cached() -> None:
+    with patch(
+        "any_agent.evaluation.llm_judge.supports_response_schema", return_value=True
+    ) as mock_supports:
+        for _ in range(3):
+            judge = LlmJudge(model_id="some-provider/cached-model")
+            assert judge.model_args["response_format"] is EvaluationOutput
+
+    mock_supports.assert_called_once_with(model="some-provider/cached-model")
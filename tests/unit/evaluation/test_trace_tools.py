@@ -0,0 +1,54 @@
+from any_agent.evaluation.tools import TraceTools
+from any_agent.tracing.agent_trace import AgentTrace
+
+
+def test_get_messages_from_trace(agent_trace: AgentTrace) -> None:
+    evidence = TraceTools(agent_trace).get_messages_from_trace()
+
+    messages = agent_trace.spans_to_messages()
+    assert evidence.count("### ") == len(messages)
+    for message in messages:
+        assert f"### {message.role}\n{message.content}\n\n" in evidence
+
+
+def test_get_all_tools() -> None:
+    tools = TraceTools(AgentTrace()).get_all_tools()
+
+    assert [tool.__name__ for tool in tools] == [
+        "get_duration",
+        "get_final_output",
+        "get_messages_from_trace",
+        "get_steps_taken",
+        "get_tokens_used",
+    ]
+
+
+def test_get_all_tools_subclass() -> None:
+    class CustomTraceTools(TraceTools):
+        def get_span_names(self) -> list[str]:
+            """Get the names of all the spans in the trace."""
+            return [span.name for span in self.trace.spans]
+
+    trace = AgentTrace()
+    tools = CustomTraceTools(trace).get_all_tools()
+
+    assert "get_span_names" in [tool.__name__ for tool in tools]
+    assert all(tool.__self__.trace is trace for tool in tools)  # type: ignore[attr-defined]
+
+
+def test_get_all_tools_instance_callables() -> None:
+    class CustomTraceTools(TraceTools):
+        def __init__(self, trace: AgentTrace) -> None:
+            super().__init__(trace)
+            self.get_span_count = lambda: len(self.trace.spans)
+            self.get_duration = None  # type: ignore[assignment]
+
+    tools = CustomTraceTools(AgentTrace()).get_all_tools()
+
+    assert [tool.__name__ for tool in tools] == [
+        "get_final_output",
+        "get_messages_from_trace",
+        "<lambda>",
+        "get_steps_taken",
+        "get_tokens_used",
+    ]
@@ -61,3 +61,218 @@ def test_run_agno_custom_args() -> None:
 
         # Verify the agent was called with the right parameters
         mock_agent_instance.arun.assert_called_once_with("foo", retries=2)
+
+
+def test_any_llm_format_messages_returns_fresh_dicts() -> None:
+    from agno.models.message import Message
+
+    from any_agent.frameworks.agno import AnyLLM
+
+    model = AnyLLM(id="mistral/mistral-small-latest")
+    messages = [
+        Message(role="user", content="What is the weather?"),
+        Message(
+            role="assistant",
+            tool_calls=[
+                {"id": "call_a", "function": {"name": "weather", "arguments": "{}"}}
+            ],
+        ),
+        Message(role="tool", content="sunny", tool_call_id="call_a", name="weather"),
+    ]
+
+    first = model._format_messages(messages)
+    # Some providers append instructions to the last message in place.
+    first[-1]["content"] += " Respond in JSON."
+    second = model._format_messages(messages)
+
+    assert second[-1] == {
+        "role": "tool",
+        "content": "sunny",
+        "tool_call_id": "call_a",
+        "name": "weather",
+    }
+    assert second[1]["tool_calls"] == [
+        {
+            "id": "call_a",
+            "type": "function",
+            "function": {"name": "weather", "arguments": "{}"},
+        }
+    ]
+    assert all(a is not b for a, b in zip(first, second, strict=True))
+
+
+def test_any_llm_parse_provider_response_delta() -> None:
+    from types import SimpleNamespace
+
+    from any_agent.frameworks.agno import AnyLLM
+
+    model = AnyLLM(id="mistral/mistral-small-latest")
+    delta = SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                delta=SimpleNamespace(
+                    content="Hi",
+                    tool_calls=[
+                        SimpleNamespace(
+                            index=1,
+                            id="call_a",
+                            function=SimpleNamespace(name="weather", arguments=None),
+                        ),
+                        SimpleNamespace(function=None),
+                    ],
+                )
+            )
+        ],
+        usage=None,
+    )
+
+    model_response = model.parse_provider_response_delta(delta)
+
+    assert model_response.content == "Hi"
+    assert model_response.tool_calls == [
+        {
+            "index": 1,
+            "type": "function",
+            "id": "call_a",
+            "function": {"name": "weather"},
+        },
+        {"index": 0, "type": "function", "function": {}},
+    ]
+    assert model_response.response_usage is None
+    assert model.parse_provider_response_delta(SimpleNamespace()).content is None
+
+
+def test_any_llm_get_request_params() -> None:
+    from any_agent.frameworks.agno import AnyLLM
+
+    model = AnyLLM(
+        id="mistral/mistral-small-latest",
+        api_key="key",
+        request_params={"temperature": 0.1},
+    )
+    tools = [{"type": "function", "function": {"name": "weather"}}]
+
+    params = model.get_request_params()
+    params["messages"] = []
+
+    assert model.get_request_params() == {
+        "model": "mistral/mistral-small-latest",
+        "api_base": None,
+        "api_key": "key",
+        "temperature": 0.1,
+    }
+    assert model.get_request_params(tools=tools) == {
+        "model": "mistral/mistral-small-latest",
+        "api_base": None,
+        "api_key": "key",
+        "temperature": 0.1,
+        "tools": tools,
+        "tool_choice": "auto",
+    }
+    assert "tools" not in model.get_request_params()
+
+
+@pytest.mark.asyncio
+async def test_update_output_type_reuses_model_and_tools() -> None:
+    from pydantic import BaseModel
+
+    class Answer(BaseModel):
+        answer: str
+
+    mock_agent = MagicMock()
+    mock_model = MagicMock()
+
+    with (
+        patch("any_agent.frameworks.agno.Agent", mock_agent),
+        patch("any_agent.frameworks.agno.DEFAULT_MODEL_TYPE", mock_model),
+    ):
+        agent = await AnyAgent.create_async(
+            AgentFramework.AGNO, AgentConfig(model_id="mistral/mistral-small-latest")
+        )
+        with patch.object(agent, "_load_tools") as mock_load_tools:
+            await agent.update_output_type_async(Answer)
+
+    mock_load_tools.assert_not_called()
+    mock_model.assert_called_once()
+    assert mock_agent.call_count == 2
+    assert mock_agent.call_args.kwargs["model"] is mock_model.return_value
+    assert mock_agent.call_args.kwargs["response_model"] is Answer
+    assert mock_agent.call_args.kwargs["tools"] is agent._loaded_tools  # type: ignore[attr-defined]
+
+
+def test_unpack_tools() -> None:
+    from agno.tools.toolkit import Toolkit
+
+    from any_agent.frameworks.agno import AgnoAgent
+
+    def search_web(query: str) -> str:
+        """Search the web."""
+        return query
+
+    def visit_webpage(url: str) -> str:
+        """Visit a webpage."""
+        return url
+
+    def final_answer(answer: str) -> str:
+        """Return the final answer."""
+        return answer
+
+    toolkit = Toolkit(name="web", tools=[search_web, visit_webpage])
+    toolkit._register_tools()
+
+    unpacked = AgnoAgent._unpack_tools([toolkit, final_answer])
+
+    assert unpacked == [*toolkit.functions.values(), final_answer]
+    assert len(unpacked) == 3
+
+
+def test_any_llm_invoke_stream_kwargs() -> None:
+    from agno.models.message import Message
+
+    from any_agent.frameworks.agno import AnyLLM
+
+    model = AnyLLM(id="mistral/mistral-small-latest", request_params={})
+    with patch("any_agent.frameworks.agno.completion") as mock_completion:
+        model.invoke_stream([Message(role="user", content="Hi")])
+        model.invoke([Message(role="user", content="Hi")])
+
+    stream_kwargs, kwargs = (c.kwargs for c in mock_completion.call_args_list)
+    assert stream_kwargs["stream"] is True
+    assert stream_kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+    assert "stream" not in kwargs
+    assert kwargs["model"] == "mistral/mistral-small-latest"
+
+
+def test_any_llm_parse_provider_response() -> None:
+    from types import SimpleNamespace
+
+    from any_agent.frameworks.agno import AnyLLM
+
+    model = AnyLLM(id="mistral/mistral-small-latest")
+    tool_call = SimpleNamespace(
+        id="call_a", function=SimpleNamespace(name="weather", arguments="{}")
+    )
+    response = SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(content=None, tool_calls=[tool_call])
+            )
+        ],
+        usage=None,
+    )
+
+    model_response = model.parse_provider_response(response)
+
+    assert model_response.content is None
+    assert model_response.tool_calls == [
+        {
+            "id": "call_a",
+            "type": "function",
+            "function": {"name": "weather", "arguments": "{}"},
+        }
+    ]
+
+    response.choices[0].message = SimpleNamespace(content="Sunny")
+    model_response = model.parse_provider_response(response)
+    assert model_response.content == "Sunny"
+    assert model_response.tool_calls == []
@@ -1,12 +1,14 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=missing-class-docstring
+import asyncio
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from any_agent import AgentConfig, AgentFramework, AnyAgent
 from any_agent.testing.helpers import LLM_IMPORT_PATHS
+from any_agent.tracing.attributes import GenAI
 
 TEST_TEMPERATURE = 0.54321
 TEST_PENALTY = 0.5
@@ -42,6 +44,17 @@ def test_create_any_with_valid_string(agent_framework: AgentFramework) -> None:
     assert agent
 
 
+def test_get_agent_type_by_framework_is_cached(
+    agent_framework: AgentFramework,
+) -> None:
+    agent_type = AnyAgent._get_agent_type_by_framework(agent_framework)
+    hits = AnyAgent._resolve_agent_type.cache_info().hits
+
+    assert AnyAgent._get_agent_type_by_framework(agent_framework.name) is agent_type
+    assert AnyAgent._resolve_agent_type.cache_info().hits == hits + 1
+    assert issubclass(agent_type, AnyAgent)
+
+
 def test_create_any_with_invalid_string() -> None:
     with pytest.raises(ValueError, match="Unsupported agent framework"):
         AnyAgent.create(
@@ -112,3 +125,51 @@ async def test_run_sync_in_async_context() -> None:
         match="Cannot use the `sync` API in an `async` context. Use the `async` API instead",
     ):
         agent.run(TEST_QUERY)
+
+
+@pytest.mark.asyncio
+async def test_invoke_agent_span() -> None:
+    agent = await AnyAgent.create_async(
+        AgentFramework.TINYAGENT,
+        AgentConfig(model_id="mistral/mistral-small-latest", name="capital_agent"),
+    )
+    with patch.object(agent, "_run_async", AsyncMock(return_value=EXPECTED_OUTPUT)):
+        traces = [await agent.run_async(TEST_QUERY) for _ in range(2)]
+
+    for trace in traces:
+        invoke_span = trace.spans[-1]
+        assert invoke_span.name == "invoke_agent [capital_agent]"
+        assert invoke_span.attributes[GenAI.OPERATION_NAME] == "invoke_agent"
+        assert invoke_span.attributes[GenAI.AGENT_NAME] == "capital_agent"
+        assert invoke_span.attributes[GenAI.AGENT_DESCRIPTION] == "No description."
+        assert (
+            invoke_span.attributes[GenAI.REQUEST_MODEL]
+            == "mistral/mistral-small-latest"
+        )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_releases_callback_context() -> None:
+    agent = await AnyAgent.create_async(
+        AgentFramework.TINYAGENT, AgentConfig(model_id="mistral/mistral-small-latest")
+    )
+    started = asyncio.Event()
+
+    async def _run_forever(*args: Any, **kwargs: Any) -> str:
+        started.set()
+        await asyncio.Event().wait()
+        return EXPECTED_OUTPUT
+
+    with (
+        patch.object(agent, "_run_async", _run_forever),
+        patch.object(agent._wrapper, "unwrap", AsyncMock()) as mock_unwrap,
+    ):
+        task = asyncio.create_task(agent.run_async(TEST_QUERY))
+        await started.wait()
+        assert len(agent._wrapper.callback_context) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert agent._wrapper.callback_context == {}
+    mock_unwrap.assert_awaited_once()
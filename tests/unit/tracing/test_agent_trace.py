@@ -1,5 +1,8 @@
+import pytest
+from pydantic import ValidationError
+
 from any_agent.testing.helpers import DEFAULT_SMALL_MODEL_ID
-from any_agent.tracing.agent_trace import AgentSpan, AgentTrace
+from any_agent.tracing.agent_trace import AgentMessage, AgentSpan, AgentTrace
 from any_agent.tracing.attributes import GenAI
 from any_agent.tracing.otel_types import Resource, SpanContext, SpanKind, Status
 
@@ -41,27 +44,47 @@ def test_tokens_and_cost_properties_are_cached() -> None:
     assert "cost" in trace.__dict__
 
 
-def test_add_span_invalidates_cache() -> None:
-    """Test that adding a span invalidates both tokens and cost caches."""
+def test_add_span_updates_cache() -> None:
+    """Test that adding a span updates both cached tokens and cost in place."""
     trace = AgentTrace()
     trace.add_span(create_llm_span(input_tokens=100, output_tokens=50))
 
     # Cache the properties
-    _ = trace.tokens
-    _ = trace.cost
+    tokens = trace.tokens
+    cost = trace.cost
     assert "tokens" in trace.__dict__
     assert "cost" in trace.__dict__
 
-    # Add another span - should invalidate cache
+    # Add another span - should fold it into the cached totals
     trace.add_span(create_llm_span(input_tokens=200, output_tokens=75))
 
+    assert trace.__dict__["tokens"] is not tokens
+    assert trace.__dict__["cost"] is not cost
+    assert trace.tokens.input_tokens == 300
+    assert trace.tokens.output_tokens == 125
+
+    # Non LLM spans leave the totals unchanged
+    tool_span = create_llm_span()
+    tool_span.attributes[GenAI.OPERATION_NAME] = "execute_tool"
+    trace.add_spans([tool_span])
+    assert trace.tokens.total_tokens == 425
+    assert trace.tokens == trace._compute_tokens_and_cost()[0]
+
+
+def test_add_span_without_cache() -> None:
+    """Test that adding spans before any access keeps the totals lazy."""
+    trace = AgentTrace()
+    trace.add_spans(
+        [
+            create_llm_span(input_tokens=100, output_tokens=50),
+            create_llm_span(input_tokens=200, output_tokens=75),
+        ]
+    )
+
     assert "tokens" not in trace.__dict__
     assert "cost" not in trace.__dict__
-
-    # Verify new calculations are correct
-    tokens = trace.tokens
-    assert tokens.input_tokens == 300
-    assert tokens.output_tokens == 125
+    assert trace.tokens.input_tokens == 300
+    assert trace.tokens.output_tokens == 125
 
 
 def test_invalidate_cache_method() -> None:
@@ -89,3 +112,51 @@ def test_spans_to_messages_handles_empty_spans() -> None:
 
     assert isinstance(messages, list)
     assert len(messages) == 0
+
+
+def test_tokens_and_cost_computed_in_single_pass() -> None:
+    """Test that accessing tokens also caches cost (and vice versa)."""
+    trace = AgentTrace()
+    trace.add_span(create_llm_span(input_tokens=100, output_tokens=50))
+
+    _ = trace.tokens
+    assert "cost" in trace.__dict__
+
+    trace._invalidate_tokens_and_cost_cache()
+    _ = trace.cost
+    assert "tokens" in trace.__dict__
+    assert trace.tokens.total_tokens == 150
+
+
+def test_cached_tokens_and_cost_are_frozen() -> None:
+    """Test that the cached totals cannot be mutated by callers."""
+    trace = AgentTrace()
+    trace.add_span(create_llm_span(input_tokens=100, output_tokens=50))
+
+    with pytest.raises(ValidationError, match="frozen"):
+        trace.tokens.input_tokens = 0
+    with pytest.raises(ValidationError, match="frozen"):
+        trace.cost.input_cost = 0.0
+    assert trace.tokens.input_tokens == 100
+
+
+def test_get_input_messages() -> None:
+    span = create_llm_span()
+    span.attributes[GenAI.INPUT_MESSAGES] = (
+        '[{"role": "system", "content": "be nice"}, {"role": "user", "content": "hi"}]'
+    )
+
+    messages = span.get_input_messages()
+
+    assert messages == [
+        AgentMessage(role="system", content="be nice"),
+        AgentMessage(role="user", content="hi"),
+    ]
+
+
+def test_get_input_messages_not_a_list() -> None:
+    span = create_llm_span()
+    span.attributes[GenAI.INPUT_MESSAGES] = '{"role": "user", "content": "hi"}'
+
+    with pytest.raises(ValueError, match="not a list of messages"):
+        span.get_input_messages()